@@ -5,29 +5,189 @@ Simple version for Ubuntu server - no Docker required
 """
 
 import time
+import atexit
+import re
+import fcntl
+import contextlib
+import multiprocessing
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import aiohttp
+from selectolax.lexbor import LexborHTMLParser
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 import requests
 from datetime import datetime
-import json
+from urllib.parse import urljoin
+from html import unescape
+import orjson
 import os
 
-# Set up logging
+# Set up logging. Records go through a queue and a background listener does
+# the actual writes, so scraping never waits on disk. Pool workers log into
+# the same queue. Set ESO_LOG_LEVEL=DEBUG for per-page and per-item detail.
+log_queue = multiprocessing.Queue()
+log_handler = QueueHandler(log_queue)
+log_level = (os.environ.get('ESO_LOG_LEVEL') or 'WARNING').upper()
+# getLevelName only maps known level names to numbers
+known_log_level = isinstance(logging.getLevelName(log_level), int)
 logging.basicConfig(
-    level=logging.INFO,
+    level=log_level if known_log_level else logging.WARNING,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('eso-scraper.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[log_handler]
 )
+log_listener = QueueListener(log_queue, logging.FileHandler('eso-scraper.log'), logging.StreamHandler())
+# Pool workers log into the parent's queue instead, see init_worker
+if multiprocessing.parent_process() is None:
+    log_listener.start()
+    atexit.register(log_listener.stop)
+if not known_log_level:
+    logging.warning(f"Unknown ESO_LOG_LEVEL {log_level!r} - using WARNING")
 
-def setup_driver():
-    """Initialize Chrome driver"""
+CROWNSTORE_URL = "https://www.elderscrollsonline.com/en-us/crownstore"
+
+# Checked first since they're the most likely to have FREE items
+PRIORITY_URLS = [
+    f"{CROWNSTORE_URL}/category/159",  # Companions
+    f"{CROWNSTORE_URL}/category/78",   # Quest Starters
+    f"{CROWNSTORE_URL}/category/78#quest-starters",
+    f"{CROWNSTORE_URL}/category/78#currency",
+    f"{CROWNSTORE_URL}/category/71",   # Events/Prologue
+    f"{CROWNSTORE_URL}/category/1",    # DLC
+    f"{CROWNSTORE_URL}/eso-plus",      # ESO Plus deals
+]
+PRIORITY_URL_SET = frozenset(PRIORITY_URLS)
+
+# Every item found in one run shares the run's timestamp
+RUN_DATE = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+# Item pages are validated over plain HTTP, this many at a time
+FETCH_CONCURRENCY = 50
+USER_AGENT = ('Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/126.0 Safari/537.36')
+FREE_PATTERN = re.compile(rb'FREE!')
+
+# Elements whose text is never shown on the page, e.g. inline JSON state
+NON_CONTENT_TAGS = frozenset(['script', 'style', 'template', 'noscript'])
+
+# Collects every element whose own text has "FREE!" into `frees`
+FREE_ELEMENTS_JS = """
+const ownText = (el, text) => [...el.childNodes].some(
+    node => node.nodeType === Node.TEXT_NODE && node.textContent.includes(text));
+const frees = [...document.querySelectorAll('*')].filter(
+    el => !el.closest('%s') && ownText(el, 'FREE!'));
+""" % ', '.join(sorted(NON_CONTENT_TAGS))
+
+# Collects one flag per "FREE!" element into `freeFlags`, saying whether it
+# belongs to the ESO Plus deal. Checking the "FREE!" element itself avoids
+# false positives from other ESO Plus items on the same page.
+FREE_FLAGS_JS = """
+const freeFlags = frees.map(el =>
+    el.closest('[class*="eso-plus-loyalty"]') !== null || ownText(el, 'With ESO Plus Deal'));
+"""
+
+FIND_FREE_SCRIPT = FREE_ELEMENTS_JS + "return frees;"
+HAS_FREE_SCRIPT = "return document.body.innerText.includes('FREE!');"
+
+# Resources Chrome never needs to download for scraping
+BLOCKED_URLS = [
+    "*.css",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.svg",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*/gtag*",
+    "*/analytics*"
+]
+
+# Where an item's name may live, best match first
+NAME_SELECTORS = ['h1', 'h2', 'h3', '[class*="title"]', '[class*="name"]']
+
+# Where an item's price is shown once the page's offer has rendered
+PRICE_SELECTOR = '[class*="price"]'
+
+# Collects the item page's image candidates (ignoring icons) into `images`
+# as [src, natural width, natural height, finished loading]. Images still
+# downloading report a natural size of 0x0.
+ITEM_IMAGES_JS = """
+const images = [...document.querySelectorAll('img[src*="/ape/uploads/"]')]
+    .filter(img => img.src.includes('akamaihd.net') && !img.src.includes('icon-crown'))
+    .map(img => [img.src, img.naturalWidth, img.naturalHeight, img.complete]);
+"""
+ITEM_IMAGES_SCRIPT = ITEM_IMAGES_JS + "return images;"
+
+# Returns the text of every name candidate (selectors passed as the first
+# argument), the ESO Plus flag of every "FREE!" element, whether a price has
+# rendered (selector passed as the second argument) and the image candidates
+# on an item page.
+ITEM_DETAILS_SCRIPT = FREE_ELEMENTS_JS + FREE_FLAGS_JS + ITEM_IMAGES_JS + """
+const names = arguments[0].flatMap(
+    selector => [...document.querySelectorAll(selector)].map(el => el.innerText.trim()));
+const priced = [...document.querySelectorAll(arguments[1])].some(el => el.innerText.trim());
+return {names: names, free_flags: freeFlags, priced: priced, images: images};
+"""
+
+# How long a FREE item's images get to finish downloading before picking one
+ITEM_IMAGE_TIMEOUT = 5
+
+# Category and rendered item pages are spread across this many headless Chromes
+CHROME_WORKERS = 4
+_worker_driver = None  # Each pool worker process holds its own driver
+
+# Chrome profiles persist here so the browser cache survives across runs.
+# The disk cache size caps each worker's profile (512 MiB across the pool).
+CHROME_PROFILE_ROOT = '/var/cache/eso-chrome'
+CHROME_DISK_CACHE_SIZE = 512 * 1024 * 1024 // CHROME_WORKERS
+
+# Fewer links than this in the static main page means it needs rendering
+MIN_DISCOVERED_URLS = 10
+
+# Discord posts go out in the background over a few keep-alive connections
+DISCORD_CONNECTIONS = 4
+DISCORD_MAX_ATTEMPTS = 3
+
+# Locating an item's link from one of its FREE elements on a category page
+ITEM_CONTAINER_XPATH = "./ancestor::*[contains(@class, 'item') or contains(@class, 'product') or contains(@class, 'card')]"
+ITEM_LINK_SELECTOR = 'a[href*="/crownstore/item/"]'
+
+# Item links as they appear in page source, with or without host and locale
+ITEM_URL_PATTERN = re.compile(r'/crownstore/item/[^"\'\s<>#]+')
+ITEM_BASE_URL = 'https://www.elderscrollsonline.com/en-us'
+
+# Signals that a page has rendered far enough to be scraped
+STORE_LINK_SELECTOR = 'a[href*="/crownstore"]'
+
+# Item tiles carry their price, so a category page is rendered once one shows.
+# Pages without any items give up after this many seconds.
+CATEGORY_RENDER_TIMEOUT = 3
+
+# Posted item IDs, one per line, only ever appended to
+POSTED_ITEMS_LOG = 'posted_items.log'
+LEGACY_POSTED_ITEMS_FILE = 'posted_items.json'
+
+# ETag/Last-Modified per Crown Store page, used to skip unchanged pages.
+# Pages are rendered again at least this often regardless.
+URL_META_FILE = 'url_meta.json'
+URL_META_MAX_AGE = 24 * 60 * 60
+
+# Parsed item pages are reused across runs for this long before revalidating
+ITEM_CACHE_FILE = 'item_cache.json'
+ITEM_CACHE_TTL = 6 * 60 * 60
+# Expired entries are kept this long for conditional requests, then dropped
+ITEM_CACHE_RETENTION = 7 * 24 * 60 * 60
+
+def setup_driver(profile_dir=None):
+    """Initialize Chrome driver, optionally on a persistent profile"""
     options = Options()
     options.add_argument('--headless')
     options.add_argument('--no-sandbox')
@@ -35,25 +195,85 @@ def setup_driver():
     options.add_argument('--disable-gpu')
     options.add_argument('--window-size=1280,720')
     options.add_argument('--disable-extensions')
-    options.add_argument('--disable-images')
+    # Return from driver.get at DOMContentLoaded; explicit waits cover the rest
+    options.page_load_strategy = 'eager'
+    if profile_dir:
+        # Keep the HTTP cache and cookies between runs
+        options.add_argument(f'--user-data-dir={profile_dir}')
+        options.add_argument(f'--disk-cache-size={CHROME_DISK_CACHE_SIZE}')
     
     driver = webdriver.Chrome(options=options)
-    driver.implicitly_wait(10)
+
+    # Skip stylesheets, fonts and trackers - only the DOM and image URLs are needed
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+
+    # Explicit waits only - implicit polling would stack on top of them
+    driver.implicitly_wait(0)
     return driver
 
+def init_worker(profile_slots, parent_log_queue):
+    """Start the Chrome instance this pool worker reuses for every task"""
+    global _worker_driver
+    # Send this worker's logs to the parent's listener
+    log_handler.queue = parent_log_queue
+
+    # Chrome refuses to share a profile, so each worker claims its own
+    slot = profile_slots.get()
+    profile_dir = os.path.join(CHROME_PROFILE_ROOT, f'worker-{slot}') if slot is not None else None
+    _worker_driver = setup_driver(profile_dir)
+    # Pool workers skip atexit handlers, but multiprocessing finalizers still run
+    multiprocessing.util.Finalize(None, _worker_driver.quit, exitpriority=10)
+
+def discover_urls():
+    """Discover Crown Store URLs (runs in a pool worker)"""
+    return get_all_crownstore_urls(_worker_driver)
+
+def discover_urls_fast():
+    """Extract Crown Store URLs from the server-rendered main page without a browser
+
+    Returns None when the HTML doesn't carry enough links to trust, so the
+    caller can fall back to rendering the page in Chrome.
+    """
+    try:
+        logging.info("Discovering Crown Store URLs over HTTP...")
+        response = requests.get(CROWNSTORE_URL, headers={'User-Agent': USER_AGENT}, timeout=10)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logging.warning(f"Could not fetch Crown Store main page: {e}")
+        return None
+
+    urls = set()
+    for link in LexborHTMLParser(response.text).css('a[href]'):
+        href = urljoin(response.url, link.attributes.get('href') or '')
+        if href.startswith(CROWNSTORE_URL):
+            urls.add(href)
+
+    if len(urls) < MIN_DISCOVERED_URLS:
+        logging.info(f"Only {len(urls)} Crown Store URLs in static HTML - rendering in Chrome instead")
+        return None
+
+    # Always include the main page
+    urls.add(CROWNSTORE_URL)
+
+    logging.info(f"Found {len(urls)} Crown Store URLs to check")
+    return list(urls)
+
 def get_all_crownstore_urls(driver):
     """Extract all Crown Store URLs from the main page"""
     urls = set()
     
     try:
         logging.info("Discovering all Crown Store URLs...")
-        driver.get("https://www.elderscrollsonline.com/en-us/crownstore")
+        driver.get(CROWNSTORE_URL)
         
-        # Wait for page to load
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        time.sleep(5)
+        # Wait until JavaScript has added the store links the static HTML was missing
+        try:
+            WebDriverWait(driver, 10).until(
+                lambda d: len(d.find_elements(By.CSS_SELECTOR, STORE_LINK_SELECTOR)) >= MIN_DISCOVERED_URLS
+            )
+        except TimeoutException:
+            logging.warning("Crown Store links still missing after rendering - using what's there")
         
         # Find all links on the page
         links = driver.find_elements(By.TAG_NAME, "a")
@@ -61,13 +281,13 @@ def get_all_crownstore_urls(driver):
         for link in links:
             try:
                 href = link.get_attribute("href")
-                if href and href.startswith("https://www.elderscrollsonline.com/en-us/crownstore"):
+                if href and href.startswith(CROWNSTORE_URL):
                     urls.add(href)
             except:
                 continue
                 
         # Always include the main page
-        urls.add("https://www.elderscrollsonline.com/en-us/crownstore")
+        urls.add(CROWNSTORE_URL)
         
         logging.info(f"Found {len(urls)} Crown Store URLs to check")
         return list(urls)
@@ -75,203 +295,303 @@ def get_all_crownstore_urls(driver):
     except Exception as e:
         logging.error(f"Error discovering URLs: {e}")
         # Fallback to main page
-        return ["https://www.elderscrollsonline.com/en-us/crownstore"]
+        return [CROWNSTORE_URL]
+
+def read_item_details(driver):
+    """Read name candidates, FREE! flags and image sizes in one round trip
+
+    Returns False until both the name and the offer (a "FREE!" or a price)
+    have rendered. The name is often in the static HTML already, the offer
+    isn't.
+    """
+    page_details = driver.execute_script(ITEM_DETAILS_SCRIPT, NAME_SELECTORS, PRICE_SELECTOR)
+    if not any(is_item_name(text) for text in page_details['names']):
+        return False
+    if not page_details['free_flags'] and not page_details['priced']:
+        return False
+    return page_details
+
+def read_item_images(driver):
+    """Read the item page's image candidates, or False while any is still downloading"""
+    images = driver.execute_script(ITEM_IMAGES_SCRIPT)
+    if all(complete for _, _, _, complete in images):
+        return images
+    return False
 
 def extract_item_details(driver, item_container, category_url, item_url=None):
-    """Extract detailed information about a free item"""
-    item_details = {}
+    """Extract detailed information about a free item
+
+    Returns None for items that aren't free. Errors while rendering or reading
+    the page are raised so callers can tell them apart from a negative result.
+    """
+    # If item_url is provided, use it directly (new approach)
+    if item_url:
+        target_url = item_url
+    else:
+        # Original approach: extract URL from container
+        target_url = None
+        try:
+            # Look for links specifically within this FREE item container
+            link_elements = item_container.find_elements(By.CSS_SELECTOR, ITEM_LINK_SELECTOR)
+            for link in link_elements:
+                href = link.get_attribute('href')
+                if href:
+                    target_url = href
+                    break
+        except:
+            pass
+        
+        # If no individual item URL found, this might be a category header - skip it
+        if not target_url:
+            return None
+    
+    # Now get the item details from the actual item page and verify it's FREE
+    item_name = None
+    is_free = False
+    is_eso_plus_free = False
     
     try:
-        # If item_url is provided, use it directly (new approach)
-        if item_url:
-            target_url = item_url
+        logging.debug("Validating item: %s", target_url)
+        driver.get(target_url)
+        # Wait until the item name and its offer have rendered, reading every
+        # "FREE!" and its ESO Plus proximity on the way
+        try:
+            page_details = WebDriverWait(driver, 10).until(read_item_details)
+        except TimeoutException:
+            raise TimeoutException("name or offer never rendered")
+        eso_plus_flags = page_details['free_flags']
+
+        if not eso_plus_flags:
+            logging.debug("Item %s is NOT free - skipping", target_url)
+            return None
+
+        logging.debug("Found %s FREE! elements on page", len(eso_plus_flags))
+
+        # Determine final classification
+        is_free = True
+        is_eso_plus_free = any(eso_plus_flags)
+        if is_eso_plus_free:
+            logging.debug("Item %s is FREE with ESO Plus (FREE! element is within eso-plus-loyalty)", target_url)
         else:
-            # Original approach: extract URL from container
-            target_url = None
-            try:
-                # Look for links specifically within this FREE item container
-                link_elements = item_container.find_elements(By.XPATH, './/a[@href]')
-                for link in link_elements:
-                    href = link.get_attribute('href')
-                    if href and '/crownstore/item/' in href:
-                        target_url = href
-                        break
-            except:
-                pass
-            
-            # If no individual item URL found, this might be a category header - skip it
-            if not target_url:
-                return None
-        
-        # Now get the item details from the actual item page and verify it's FREE
-        item_name = None
-        is_free = False
-        is_eso_plus_free = False
+            logging.debug("Item %s is FREE for everyone (FREE! element is not within eso-plus-loyalty)", target_url)
+
+        item_name = next((text for text in page_details['names'] if is_item_name(text)), None)
+
+    except Exception as e:
+        logging.warning(f"Could not validate item {target_url}: {e}")
+        raise
+    
+    if not item_name or not is_free:
+        return None
         
+    item_details = make_item_details(item_name, target_url, category_url, None, is_eso_plus_free)
+    
+    # Sizes are only known once images have loaded, which eager page loads
+    # don't wait for
+    images = page_details['images']
+    if not all(complete for _, _, _, complete in images):
         try:
-            logging.info(f"Validating item: {target_url}")
-            driver.get(target_url)
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(2)
-            
-            # Check for FREE indicators
-            free_elements = driver.find_elements(By.XPATH, "//*[contains(text(), 'FREE!')]")
-            
-            if not free_elements:
-                logging.info(f"Item {target_url} is NOT free - skipping")
-                return None
-            
-            # Proximity-based ESO Plus detection: check if the "FREE!" text itself is within eso-plus-loyalty
-            # This avoids false positives from other ESO Plus items on the same page
-            
-            # Find all "FREE!" elements on the page
-            all_free_elements = driver.find_elements(By.XPATH, "//*[contains(text(), 'FREE!')]")
-            
-            logging.info(f"Found {len(all_free_elements)} FREE! elements on page")
-            
-            is_eso_plus_free_found = False
-            
-            for i, free_element in enumerate(all_free_elements):
-                try:
-                    logging.info(f"Analyzing FREE! element {i+1}:")
-                    logging.info(f"  Element tag: {free_element.tag_name}")
-                    logging.info(f"  Element text: '{free_element.text.strip()}'")
-                    logging.info(f"  Element classes: {free_element.get_attribute('class')}")
-                    
-                    # Check parent element
-                    try:
-                        parent = free_element.find_element(By.XPATH, "./..")
-                        logging.info(f"  Parent tag: {parent.tag_name}")
-                        logging.info(f"  Parent classes: {parent.get_attribute('class')}")
-                    except:
-                        logging.info(f"  Could not get parent element")
-                    
-                    # Check if this specific "FREE!" element is within an eso-plus-loyalty container
-                    # Check both the element itself AND its ancestors
-                    loyalty_element = free_element.find_elements(By.XPATH, 
-                        "./ancestor-or-self::*[contains(@class, 'eso-plus-loyalty')]")
-                    
-                    logging.info(f"  ESO Plus loyalty elements (self or ancestors) found: {len(loyalty_element)}")
-                    
-                    if loyalty_element:
-                        # This "FREE!" text is within an eso-plus-loyalty container
-                        is_eso_plus_free_found = True
-                        logging.info(f"  ✓ This FREE! element IS within or has eso-plus-loyalty class")
-                        break
-                    else:
-                        logging.info(f"  ✗ This FREE! element does NOT have eso-plus-loyalty class")
-                        
-                except Exception as e:
-                    logging.warning(f"Error checking FREE! element {i+1} for ESO Plus ancestry: {e}")
-                    continue
-            
-            # Additional check: look for "FREE!" text that contains "With ESO Plus Deal" in same element
-            eso_plus_free_text = driver.find_elements(By.XPATH, 
-                "//*[contains(text(), 'FREE!') and contains(text(), 'With ESO Plus Deal')]")
-            
-            logging.info(f"Found {len(eso_plus_free_text)} elements with both 'FREE!' and 'With ESO Plus Deal'")
-            
-            if eso_plus_free_text:
-                is_eso_plus_free_found = True
-                logging.info(f"Found FREE! text with 'With ESO Plus Deal' in same element")
-            
-            # Debug: show what we found
-            logging.info(f"Proximity analysis - ESO Plus FREE found: {is_eso_plus_free_found}")
-            
-            # Determine final classification
-            if is_eso_plus_free_found:
-                is_free = True
-                is_eso_plus_free = True
-                logging.info(f"Item {target_url} is FREE with ESO Plus (FREE! element has eso-plus-loyalty class)")
-            else:
-                is_free = True
-                is_eso_plus_free = False
-                logging.info(f"Item {target_url} is FREE for everyone (FREE! element does not have eso-plus-loyalty class)")
-            
-            # Extract the actual item name from the item page
-            name_selectors = [
-                '//h1',
-                '//h2', 
-                '//h3',
-                '//*[@class*="title"]',
-                '//*[@class*="name"]',
-                '//*[@class*="item-name"]',
-                '//*[@class*="product-name"]'
-            ]
-            
-            for selector in name_selectors:
-                elements = driver.find_elements(By.XPATH, selector)
-                for element in elements:
-                    text = element.text.strip()
-                    if text and len(text) > 2 and 'crown store' not in text.lower() and 'purchase crowns' not in text.lower():
-                        item_name = text
-                        break
-                if item_name:
-                    break
-                    
-        except Exception as e:
-            logging.warning(f"Could not validate item {target_url}: {e}")
+            images = WebDriverWait(driver, ITEM_IMAGE_TIMEOUT).until(read_item_images)
+        except TimeoutException:
+            logging.debug("Images still loading on %s", target_url)
+            images = driver.execute_script(ITEM_IMAGES_SCRIPT)
+
+    # Pick the largest main item image, ignoring thumbnails
+    large_images = [image for image in images if image[1] > 100 and image[2] > 100]
+    unloaded_images = [image for image in images if not image[3]]
+
+    main_image = None
+    if large_images:
+        main_image = max(large_images, key=lambda image: image[1] * image[2])[0]
+    elif unloaded_images:
+        # Still unknown after waiting - better a guess than no image at all
+        main_image = unloaded_images[0][0]
+
+    if main_image:
+        item_details['image_url'] = main_image
+        logging.debug("Found image: %s", main_image)
+    
+    return item_details
+
+def make_item_details(name, url, category_url, image_url, is_eso_plus_free):
+    """Build the item record that gets posted and saved"""
+    return {
+        'name': name,  # Keep name clean, no ESO Plus in the name
+        'url': url,
+        'category_url': category_url,
+        'image_url': image_url,
+        'is_eso_plus_free': is_eso_plus_free,
+        'found_date': RUN_DATE
+    }
+
+def make_item_id(item_details):
+    """Unique identifier used to avoid posting the same item twice"""
+    # Rendered names come back uppercased by the site's CSS, static HTML does not.
+    # Whitespace is collapsed so the ID always fits on one line of the posted log.
+    name = ' '.join(item_details['name'].split()).upper()
+    return f"{name}-{item_details['is_eso_plus_free']}"
+
+def is_item_name(text):
+    """Whether a heading's text looks like an item name rather than store chrome"""
+    return len(text) > 2 and 'crown store' not in text.lower() and 'purchase crowns' not in text.lower()
+
+def is_hidden_markup(node):
+    """Check whether a node sits inside markup that is never rendered as text"""
+    while node is not None:
+        if node.tag in NON_CONTENT_TAGS:
+            return True
+        node = node.parent
+    return False
+
+def has_static_price(tree):
+    """Whether a price container with text is part of the page's visible markup
+
+    Only the price container counts - "N Crowns" in banners, footers or
+    inline JSON says nothing about this item's offer.
+    """
+    return any(node.text(strip=True) and not is_hidden_markup(node) for node in tree.css(PRICE_SELECTOR))
+
+def parse_item_html(html):
+    """Parse a static item page into (is_free, is_eso_plus_free, name, image_url)
+
+    Returns None when the page has no usable name or shows neither "FREE!" nor
+    a price container, i.e. it needs JavaScript to render and has to go through
+    Selenium instead.
+    """
+    tree = LexborHTMLParser(html)
+
+    # Only the h1 is trusted here. The Selenium path falls back to other
+    # headings, but in static HTML those are site chrome whenever the item's
+    # own h1 is rendered client-side.
+    names = (node.text(strip=True) for node in tree.css('h1'))
+    item_name = next((text for text in names if is_item_name(text)), None)
+
+    if not item_name:
+        return None
+
+    # Cheap byte scan before walking the DOM
+    if not FREE_PATTERN.search(html):
+        # Without a price either, the offer is rendered client-side
+        if not has_static_price(tree):
             return None
-        
-        if not item_name or not is_free:
+        return (False, False, item_name, None)
+
+    is_free = False
+    is_eso_plus_free = False
+    for node in tree.css('*'):
+        text = node.text(deep=False)
+        if 'FREE!' not in text or is_hidden_markup(node):
+            continue
+        is_free = True
+
+        # Only count ESO Plus when this "FREE!" text itself sits inside eso-plus-loyalty
+        if 'With ESO Plus Deal' in text:
+            is_eso_plus_free = True
+            break
+        ancestor = node
+        while ancestor is not None:
+            if 'eso-plus-loyalty' in (ancestor.attributes.get('class') or ''):
+                is_eso_plus_free = True
+                break
+            ancestor = ancestor.parent
+        if is_eso_plus_free:
+            break
+
+    if not is_free and not has_static_price(tree):
+        return None
+
+    # Prefer the largest declared image, falling back to the first one found
+    images = {}
+    for img in tree.css('img[src*="/ape/uploads/"]'):
+        src = img.attributes.get('src')
+        if not src or 'akamaihd.net' not in src or 'icon-crown' in src:
+            continue
+        try:
+            images.setdefault(src, int(img.attributes.get('width')) * int(img.attributes.get('height')))
+        except (TypeError, ValueError):
+            images.setdefault(src, 0)
+    image_url = max(images, key=images.get) if images else None
+
+    return (is_free, is_eso_plus_free, item_name, image_url)
+
+async def fetch_item(session, semaphore, url, item_cache):
+    """Fetch and parse an item page without a browser, revalidating cached copies"""
+    cached = item_cache.get(url)
+    if cached and time.time() < cached['expires']:
+        logging.debug("Using cached item: %s", url)
+        return tuple(cached['result'])
+
+    headers = {}
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+
+    async with semaphore:
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304 and cached:
+                    logging.debug("Item unchanged since last run: %s", url)
+                    cached['expires'] = time.time() + ITEM_CACHE_TTL
+                    return tuple(cached['result'])
+                if response.status != 200:
+                    logging.warning(f"Could not fetch item {url}: HTTP {response.status}")
+                    return None
+                html = await response.read()
+                response_headers = response.headers
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.warning(f"Could not fetch item {url}: {e}")
             return None
-            
-        item_details = {
-            'name': item_name,  # Keep name clean, no ESO Plus in the name
-            'url': target_url,
-            'category_url': category_url,
-            'image_url': None,
-            'is_eso_plus_free': is_eso_plus_free,
-            'found_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    logging.debug("Validated item: %s", url)
+    result = parse_item_html(html)
+
+    if result is not None and 'no-store' not in response_headers.get('Cache-Control', ''):
+        item_cache[url] = {
+            'result': list(result),
+            'etag': response_headers.get('ETag'),
+            'last_modified': response_headers.get('Last-Modified'),
+            'expires': time.time() + ITEM_CACHE_TTL
         }
-        
-        # Try to get the main item image while we're on the item page
-        try:
-            # Look for the main item image - be more selective
-            main_image = None
-            try:
-                # Try to find the primary item image
-                img_elements = driver.find_elements(By.XPATH, '//img[contains(@src, "/ape/uploads/")]')
-                
-                # Filter out duplicate images and find the largest/most relevant one
-                unique_images = {}
-                for img in img_elements:
-                    src = img.get_attribute('src')
-                    if (src and 
-                        'akamaihd.net' in src and 
-                        '/ape/uploads/' in src and
-                        'icon-crown' not in src):
-                        
-                        # Get image dimensions to prefer larger images
-                        try:
-                            width = img.size.get('width', 0)
-                            height = img.size.get('height', 0)
-                            if width > 100 and height > 100:  # Only larger images
-                                unique_images[src] = width * height
-                        except:
-                            unique_images[src] = 0
-                
-                # Get the largest unique image
-                if unique_images:
-                    main_image = max(unique_images.keys(), key=lambda k: unique_images[k])
-                    item_details['image_url'] = main_image
-                    logging.info(f"Found image: {main_image}")
-                    
-            except Exception as e:
-                logging.warning(f"Could not get image for {item_name}: {e}")
-                
-        except Exception as e:
-            logging.warning(f"Could not get image for {item_name}: {e}")
-        
-        return item_details
-        
+    return result
+
+def create_fetch_session():
+    """Create the shared session item pages are fetched over"""
+    connector = aiohttp.TCPConnector(limit=FETCH_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=30)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout, headers={'User-Agent': USER_AGENT})
+
+async def check_item(session, semaphore, pool, item_url, category_url, item_cache, failed_items):
+    """Validate one candidate item, falling back to Chrome when static HTML isn't enough
+
+    Items that couldn't be validated because of an error are added to failed_items.
+    """
+    try:
+        result = await fetch_item(session, semaphore, item_url, item_cache)
+
+        if result is None:
+            # Static HTML wasn't enough - let Chrome render the page
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(pool, validate_item, item_url, category_url)
+
+        is_free, is_eso_plus_free, item_name, image_url = result
+        if not is_free:
+            logging.debug("Item %s is NOT free - skipping", item_url)
+            return None
+        return make_item_details(item_name, item_url, category_url, image_url, is_eso_plus_free)
+
     except Exception as e:
-        logging.warning(f"Error extracting item details: {e}")
+        logging.warning(f"Error processing item {item_url}: {e}")
+        failed_items.add(item_url)
         return None
 
-def send_item_to_discord(item_details, webhook_url):
+def create_discord_session():
+    """Create a keep-alive session for posting to the Discord webhook"""
+    connector = aiohttp.TCPConnector(limit_per_host=DISCORD_CONNECTIONS)
+    timeout = aiohttp.ClientTimeout(total=10)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+async def send_item_to_discord(session, item_details, webhook_url):
     """Send individual item to Discord immediately"""
     try:
         # Check if item is ESO Plus free and modify message accordingly
@@ -287,154 +607,327 @@ def send_item_to_discord(item_details, webhook_url):
             "avatar_url": "http://137.184.15.191/webhook-avatar.png"
         }
         
-        response = requests.post(webhook_url, json=data)
-        if response.status_code == 204:
+        for attempt in range(DISCORD_MAX_ATTEMPTS):
+            async with session.post(webhook_url, json=data) as response:
+                status = response.status
+                retry_after = float(response.headers.get('Retry-After', 1))
+            if status != 429 or attempt + 1 == DISCORD_MAX_ATTEMPTS:
+                break
+            # Rate limited - only this post waits, the others carry on
+            logging.warning(f"Discord rate limited, retrying {item_details['name']} in {retry_after}s")
+            await asyncio.sleep(retry_after)
+
+        if status == 204:
             logging.info(f"Sent Discord message for: {item_details['name']} ({free_text})")
             return True
         else:
-            logging.error(f"Failed to send Discord message for {item_details['name']}: {response.status_code}")
+            logging.error(f"Failed to send Discord message for {item_details['name']}: {status}")
             return False
             
     except Exception as e:
         logging.error(f"Error sending item to Discord: {e}")
         return False
 
+async def process_items(item_categories, item_cache, pool, posted_items, posted_log, free_items,
+                        failed_items, webhook_url):
+    """Validate candidate items concurrently and post new FREE ones as soon as they're confirmed"""
+    pending_posts = []  # In-flight Discord posts; posted_items already rules out duplicates
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+    async with create_fetch_session() as session, create_discord_session() as discord_session:
+        checks = [check_item(session, semaphore, pool, item_url, category_url, item_cache, failed_items)
+                  for item_url, category_url in item_categories.items()]
+        try:
+            for check in asyncio.as_completed(checks):
+                item_details = await check
+                if not item_details:
+                    continue
+
+                # Create unique identifier for this item
+                item_id = make_item_id(item_details)
+
+                if item_id in posted_items:
+                    logging.debug("Skipping already posted item: %s", item_details['name'])
+                    continue
+
+                # Add to our tracking lists
+                free_items.append(item_details)
+                posted_items.add(item_id)
+                record_posted_item(posted_log, item_id)
+
+                logging.info(f"Found FREE item: {item_details['name']} on {item_details['category_url']}")
+
+                # Send to Discord without holding up validation
+                if webhook_url:
+                    pending_posts.append(asyncio.create_task(
+                        send_item_to_discord(discord_session, item_details, webhook_url)))
+        finally:
+            # Drain posts still in flight before the session closes
+            sent = await asyncio.gather(*pending_posts)
+            logging.info(f"Sent {sum(sent)} of {len(sent)} Discord messages")
+
 def load_posted_items():
-    """Load previously posted items from file"""
-    posted_file = 'posted_items.json'
+    """Load previously posted items from the append-only log"""
     try:
-        if os.path.exists(posted_file):
-            with open(posted_file, 'r') as f:
-                return set(json.load(f))
+        if os.path.exists(POSTED_ITEMS_LOG):
+            with open(POSTED_ITEMS_LOG, 'r') as f:
+                return {line.rstrip('\n') for line in f if line.strip()}
+
+        # One-time migration from the old JSON list
+        if os.path.exists(LEGACY_POSTED_ITEMS_FILE):
+            with open(LEGACY_POSTED_ITEMS_FILE, 'rb') as f:
+                posted_items = set(orjson.loads(f.read()))
+            with open(POSTED_ITEMS_LOG, 'w') as f:
+                f.writelines(f"{item_id}\n" for item_id in posted_items)
+            logging.info(f"Migrated {len(posted_items)} posted items to {POSTED_ITEMS_LOG}")
+            return posted_items
     except Exception as e:
         logging.warning(f"Could not load posted items: {e}")
     return set()
 
-def save_posted_items(posted_items):
-    """Save posted items to file"""
-    posted_file = 'posted_items.json'
+def record_posted_item(log_file, item_id):
+    """Append a newly posted item to the log right away"""
+    try:
+        log_file.write(f"{item_id}\n")
+        log_file.flush()
+    except Exception as e:
+        logging.error(f"Could not record posted item {item_id}: {e}")
+
+def load_item_cache():
+    """Load cached item page results from file"""
+    try:
+        if os.path.exists(ITEM_CACHE_FILE):
+            with open(ITEM_CACHE_FILE, 'rb') as f:
+                return orjson.loads(f.read())
+    except Exception as e:
+        logging.warning(f"Could not load item cache: {e}")
+    return {}
+
+def save_item_cache(item_cache):
+    """Save cached item page results to file, dropping long-expired entries"""
+    cutoff = time.time() - ITEM_CACHE_RETENTION
+    item_cache = {url: entry for url, entry in item_cache.items() if entry['expires'] > cutoff}
+    try:
+        with open(ITEM_CACHE_FILE, 'wb') as f:
+            f.write(orjson.dumps(item_cache))
+    except Exception as e:
+        logging.error(f"Could not save item cache: {e}")
+
+def load_url_meta():
+    """Load the cache validators seen for each page on the last run"""
+    try:
+        if os.path.exists(URL_META_FILE):
+            with open(URL_META_FILE, 'rb') as f:
+                return orjson.loads(f.read())
+    except Exception as e:
+        logging.warning(f"Could not load URL metadata: {e}")
+    return {}
+
+def save_url_meta(url_meta):
+    """Save the cache validators seen for each page"""
     try:
-        with open(posted_file, 'w') as f:
-            json.dump(list(posted_items), f, indent=2)
+        with open(URL_META_FILE, 'wb') as f:
+            f.write(orjson.dumps(url_meta))
     except Exception as e:
-        logging.error(f"Could not save posted items: {e}")
+        logging.error(f"Could not save URL metadata: {e}")
+
+def probe_page(url, validators):
+    """Ask the server whether a page changed since the last run
+
+    Returns the page's current validators, or None when the server answers
+    304 Not Modified.
+
+    This only covers the server-rendered HTML shell. Content that JavaScript
+    loads afterwards can change without the shell changing, so validators
+    older than URL_META_MAX_AGE are ignored and the page is rendered again.
+    """
+    headers = {'User-Agent': USER_AGENT}
+    if time.time() - validators.get('checked', 0) < URL_META_MAX_AGE:
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+    try:
+        response = requests.head(url, headers=headers, timeout=5, allow_redirects=True)
+    except requests.RequestException as e:
+        logging.debug("Could not probe %s: %s", url, e)
+        return {}
+
+    if response.status_code == 304:
+        return None
+    return {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'checked': time.time()
+    }
+
+def find_free_item_urls(driver, url):
+    """Collect item URLs from the containers around each FREE element"""
+    # Find all FREE items
+    free_elements = driver.execute_script(FIND_FREE_SCRIPT)
+    logging.debug("Found %s potential FREE items on %s", len(free_elements), url)
+
+    # First, collect all item URLs from this page to avoid stale element issues
+    item_urls_to_check = {}  # Ordered set to avoid duplicates on same page
+    for element in free_elements:
+        try:
+            # Find the item container
+            item_container = element.find_element(By.XPATH, ITEM_CONTAINER_XPATH)
+
+            # Look for links specifically within this FREE item container
+            link_elements = item_container.find_elements(By.CSS_SELECTOR, ITEM_LINK_SELECTOR)
+            for link in link_elements:
+                href = link.get_attribute('href')
+                if href:
+                    item_urls_to_check[href] = None  # Dict keys deduplicate in page order
+                    break
+
+        except Exception as e:
+            logging.warning(f"Error extracting URL from element on {url}: {e}")
+            continue
+
+    return item_urls_to_check
+
+def scan_category(url, validators):
+    """Collect candidate item URLs from a Crown Store page (runs in a pool worker)
+
+    Returns the item URLs along with the validators to remember for the page.
+    """
+    try:
+        # Don't bother rendering a page that hasn't changed since the last run
+        new_validators = probe_page(url, validators)
+        if new_validators is None:
+            logging.debug("Unchanged since last run: %s", url)
+            return [], validators
+
+        logging.debug("Checking URL: %s", url)
+        _worker_driver.get(url)
+
+        # Let JavaScript render the item tiles. Pages without any are still
+        # scanned, but keep their old validators so they're rendered again
+        # next run rather than trusted as having nothing FREE
+        try:
+            WebDriverWait(_worker_driver, CATEGORY_RENDER_TIMEOUT).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, PRICE_SELECTOR))
+            )
+        except TimeoutException:
+            logging.debug("No item tiles rendered on %s", url)
+            new_validators = validators
+
+        # Cheap text check before walking the DOM
+        if not _worker_driver.execute_script(HAS_FREE_SCRIPT):
+            logging.debug("Found 0 potential FREE items on %s", url)
+            return [], new_validators
+
+        # Pull every item link out of the rendered HTML in one pass; item pages
+        # are validated over HTTP anyway, so over-collecting is cheap
+        # (page_source is serialized HTML, so query strings come back as &amp;)
+        item_urls_to_check = dict.fromkeys(
+            ITEM_BASE_URL + unescape(path)
+            for path in ITEM_URL_PATTERN.findall(_worker_driver.page_source))
+        logging.debug("Found %s candidate items on %s", len(item_urls_to_check), url)
+
+        if not item_urls_to_check:
+            item_urls_to_check = find_free_item_urls(_worker_driver, url)
+
+        return list(item_urls_to_check), new_validators
 
-def scrape_free_items():
-    """Scrape FREE items from all ESO Crown Store pages"""
-    driver = setup_driver()
+    except Exception as e:
+        logging.warning(f"Error checking URL {url}: {e}")
+        # Keep the old validators so the page isn't skipped next time
+        return [], validators
+
+def validate_item(item_url, category_url):
+    """Render and validate an item page in Chrome (runs in a pool worker)"""
+    return extract_item_details(_worker_driver, None, category_url, item_url)
+
+def scrape_free_items(persistent_profiles=True):
+    """Scrape FREE items from all ESO Crown Store pages
+
+    Without persistent_profiles every Chrome starts from a throwaway profile.
+    """
+    profile_slots = multiprocessing.Queue()
+    for slot in range(CHROME_WORKERS):
+        profile_slots.put(slot if persistent_profiles else None)
+    pool = ProcessPoolExecutor(max_workers=CHROME_WORKERS, initializer=init_worker,
+                               initargs=(profile_slots, log_queue))
     free_items = []
-    processed_urls = set()  # Track URLs we've already processed globally
+    item_categories = {}  # Candidate item URL -> first category it was seen on
     webhook_url = "https://discord.com/api/webhooks/1390384861101035600/gehtJILtdByfCLmW-pmLYc8haQlBsYLzPBxKqfsoQAfdoDPMK5c1fR6CpkVB7JVAnJ7S"
     
     # Load previously posted items to avoid duplicates
     posted_items = load_posted_items()
-    new_posted_items = set(posted_items)  # Copy to track new additions
+    posted_log = open(POSTED_ITEMS_LOG, 'a')
     logging.info(f"Loaded {len(posted_items)} previously posted items")
     
     try:
         # Get all Crown Store URLs
-        all_urls = get_all_crownstore_urls(driver)
-        
-        # Prioritize URLs likely to have FREE items
-        priority_urls = [
-            "https://www.elderscrollsonline.com/en-us/crownstore/category/159",  # Companions
-            "https://www.elderscrollsonline.com/en-us/crownstore/category/78",   # Quest Starters  
-            "https://www.elderscrollsonline.com/en-us/crownstore/category/78#quest-starters",
-            "https://www.elderscrollsonline.com/en-us/crownstore/category/78#currency",
-            "https://www.elderscrollsonline.com/en-us/crownstore/category/71",   # Events/Prologue
-            "https://www.elderscrollsonline.com/en-us/crownstore/category/1",    # DLC
-            "https://www.elderscrollsonline.com/en-us/crownstore/eso-plus",      # ESO Plus deals
-        ]
+        all_urls = discover_urls_fast() or pool.submit(discover_urls).result()
         
         # Remove priority URLs from all_urls and add them at the front
-        remaining_urls = [url for url in all_urls if url not in priority_urls]
-        urls_to_check = priority_urls + remaining_urls
+        remaining_urls = [url for url in dict.fromkeys(all_urls) if url not in PRIORITY_URL_SET]
+        urls_to_check = PRIORITY_URLS + remaining_urls
         
-        logging.info(f"Checking {len(priority_urls)} priority URLs first, then {len(remaining_urls)} remaining URLs")
+        logging.info(f"Checking {len(PRIORITY_URLS)} priority URLs first, then {len(remaining_urls)} remaining URLs")
         
-        for url in urls_to_check:
-            try:
-                logging.info(f"Checking URL: {url}")
-                driver.get(url)
-                
-                # Wait for page to load
-                WebDriverWait(driver, 20).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-                time.sleep(3)  # Let JavaScript render
-                
-                # Find all FREE items
-                free_elements = driver.find_elements(By.XPATH, "//*[contains(text(), 'FREE!')]")
-                logging.info(f"Found {len(free_elements)} potential FREE items on {url}")
-                
-                # First, collect all item URLs from this page to avoid stale element issues
-                item_urls_to_check = set()  # Use set to avoid duplicates on same page
-                for element in free_elements:
-                    try:
-                        # Find the item container
-                        item_container = element.find_element(By.XPATH, "./ancestor::*[contains(@class, 'item') or contains(@class, 'product') or contains(@class, 'card')]")
-                        
-                        # Look for links specifically within this FREE item container
-                        link_elements = item_container.find_elements(By.XPATH, './/a[@href]')
-                        for link in link_elements:
-                            href = link.get_attribute('href')
-                            if href and '/crownstore/item/' in href:
-                                item_urls_to_check.add(href)  # Set automatically deduplicates
-                                break
-                                
-                    except Exception as e:
-                        logging.warning(f"Error extracting URL from element on {url}: {e}")
-                        continue
-                
-                # Now process each collected URL (skip if already processed globally)
-                for item_url in item_urls_to_check:
-                    if item_url in processed_urls:
-                        logging.info(f"Skipping already processed item: {item_url}")
-                        continue
-                        
-                    processed_urls.add(item_url)  # Mark as processed
-                    
-                    try:
-                        # Extract detailed item information
-                        item_details = extract_item_details(driver, None, url, item_url)
-                        
-                        if item_details:
-                            # Create unique identifier for this item
-                            item_id = f"{item_details['name']}-{item_details['is_eso_plus_free']}"
-                            
-                            if item_id not in posted_items:
-                                # Add to our tracking lists
-                                free_items.append(item_details)
-                                new_posted_items.add(item_id)
-                                
-                                logging.info(f"Found FREE item: {item_details['name']} on {url}")
-                                
-                                # Send to Discord immediately
-                                if webhook_url:
-                                    send_item_to_discord(item_details, webhook_url)
-                            else:
-                                logging.info(f"Skipping already posted item: {item_details['name']}")
-                            
-                    except Exception as e:
-                        logging.warning(f"Error processing item {item_url}: {e}")
-                        continue
-                        
-            except Exception as e:
-                logging.warning(f"Error checking URL {url}: {e}")
-                continue
-                
+        old_url_meta = load_url_meta()
+        url_meta = dict(old_url_meta)
+        scans = pool.map(scan_category, urls_to_check, [old_url_meta.get(url, {}) for url in urls_to_check])
+
+        for url, (item_urls_to_check, validators) in zip(urls_to_check, scans):
+            url_meta[url] = validators
+
+            # Queue each collected URL for validation (skip if already queued globally)
+            for item_url in item_urls_to_check:
+                if item_url in item_categories:
+                    logging.debug("Skipping already processed item: %s", item_url)
+                    continue
+
+                item_categories[item_url] = url
+
+        # Validate every candidate item page concurrently over plain HTTP
+        logging.info(f"Validating {len(item_categories)} candidate items")
+        item_cache = load_item_cache()
+        failed_items = set()
+        try:
+            asyncio.run(process_items(item_categories, item_cache, pool, posted_items,
+                                      posted_log, free_items, failed_items, webhook_url))
+        finally:
+            save_item_cache(item_cache)
+
+        # Only remember a page as seen once all of its items were validated,
+        # otherwise the next run would skip it and never retry the failures
+        for item_url in failed_items:
+            category_url = item_categories[item_url]
+            url_meta[category_url] = old_url_meta.get(category_url, {})
+        save_url_meta(url_meta)
+
     except Exception as e:
         logging.error(f"Scraping failed: {e}")
     finally:
-        driver.quit()
+        pool.shutdown()
         
-    # Save updated posted items list
-    save_posted_items(new_posted_items)
-    new_items_count = len(new_posted_items) - len(posted_items)
-    logging.info(f"Found {new_items_count} new items, {len(new_posted_items)} total items tracked")
+    posted_log.close()
+    logging.info(f"Found {len(free_items)} new items, {len(posted_items)} total items tracked")
     
     return free_items
 
+def acquire_run_lock():
+    """Take an exclusive lock so overlapping runs can't share Chrome profiles
+
+    Returns None when another run holds the lock, and raises OSError when
+    CHROME_PROFILE_ROOT isn't writable.
+    """
+    os.makedirs(CHROME_PROFILE_ROOT, exist_ok=True)
+    lock_file = open(os.path.join(CHROME_PROFILE_ROOT, 'scraper.lock'), 'w')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.close()
+        return None
+    return lock_file
+
 def main():
     # Get Discord webhook URL from environment variable
     webhook_url = "https://discord.com/api/webhooks/1390384861101035600/gehtJILtdByfCLmW-pmLYc8haQlBsYLzPBxKqfsoQAfdoDPMK5c1fR6CpkVB7JVAnJ7S"
@@ -442,12 +935,26 @@ def main():
         logging.error("DISCORD_WEBHOOK_URL environment variable not set")
         return
     
+    # Only one run may use the Chrome profiles at a time
+    persistent_profiles = True
+    try:
+        run_lock = acquire_run_lock()
+    except OSError as e:
+        # e.g. a non-root cron job - nothing to share, so no lock is needed
+        logging.warning(f"Can't use {CHROME_PROFILE_ROOT} ({e}) - running with throwaway Chrome profiles")
+        run_lock = contextlib.nullcontext()
+        persistent_profiles = False
+    if run_lock is None:
+        logging.error("Another scraper run is still in progress")
+        return
+
     # Scrape free items
-    free_items = scrape_free_items()
+    with run_lock:
+        free_items = scrape_free_items(persistent_profiles)
     
     # Save results
-    with open('eso-free-items.json', 'w') as f:
-        json.dump(free_items, f, indent=2)
+    with open('eso-free-items.json', 'wb') as f:
+        f.write(orjson.dumps(free_items, option=orjson.OPT_INDENT_2))
     
     logging.info("Scraper completed successfully")
 